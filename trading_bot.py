@@ -1,30 +1,334 @@
+import asyncio
+import atexit
+import hashlib
+import hmac
 import logging
+import logging.handlers
+import os
+import queue
+import socket
 import sys
+import threading
+import time
+import uuid
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+import requests
 from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceOrderException
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceRequestException
 import json
 
-# Configure logging
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard library json module
+    orjson = None
+
+try:
+    import websockets
+except ImportError:  # installed with python-binance, only needed for the WebSocket API
+    websockets = None
+
+# Configure logging: file records are formatted on the calling thread and written
+# by a background listener so file I/O stays off the order placement path. Console
+# output is only added when stdout is a terminal, and is written synchronously so
+# it stays in order with the CLI prompts.
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(_log_formatter)
+_root_handlers = [_queue_handler]
+
+if sys.stdout.isatty():
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setFormatter(_log_formatter)
+    _root_handlers.append(_console_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'trading_bot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=_root_handlers
 )
 
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(f'trading_bot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+# Order summary logged after every successful order
+ORDER_DETAILS_FORMAT = "\n".join([
+    "="*50,
+    "ORDER EXECUTED SUCCESSFULLY",
+    "="*50,
+    "Order ID: %s",
+    "Symbol: %s",
+    "Side: %s",
+    "Type: %s",
+    "Quantity: %s",
+    "Price: %s",
+    "Status: %s",
+    "Time: %s",
+    "="*50
+])
+
+# Alternate USD-M futures hosts; the fastest one is picked at startup in live mode
+FUTURES_HOSTS = ['fapi.binance.com', 'fapi1.binance.com', 'fapi2.binance.com', 'fapi3.binance.com']
+
+# Maximum pooled connections per host
+POOL_MAXSIZE = 16
+
+# Seconds between keep-alive pings; below Binance's ~90 s idle connection timeout
+KEEPALIVE_INTERVAL = 60
+
+# Futures WebSocket API endpoints (signed requests over a persistent connection)
+WS_API_URL = 'wss://ws-fapi.binance.com/ws-fapi/v1'
+WS_API_TESTNET_URL = 'wss://testnet.binancefuture.com/ws-fapi/v1'
+
+
+if orjson is not None:
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+
+class HmacSigner:
+    """HMAC-SHA256 signer that derives the keyed state once and copies it per request."""
+    
+    def __init__(self, secret: str):
+        self._hmac_template = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    
+    def sign(self, query: bytes) -> str:
+        """Return the hex signature of a query string."""
+        ctx = self._hmac_template.copy()
+        ctx.update(query)
+        return ctx.hexdigest()
+
+
+class BotClient(Client):
+    """
+    python-binance Client that signs requests with a precomputed HMAC key and
+    decodes API responses with orjson when available.
+    """
+    
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, **kwargs):
+        self._signer = HmacSigner(api_secret) if api_secret else None
+        super().__init__(api_key, api_secret, **kwargs)
+    
+    def _generate_signature(self, data: Dict) -> str:
+        if self._signer is None or getattr(self, 'PRIVATE_KEY', None):
+            return super()._generate_signature(data)
+        query_string = '&'.join(f"{key}={value}" for key, value in self._order_params(data))
+        return self._signer.sign(query_string.encode())
+    
+    @staticmethod
+    def _handle_response(response):
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return json_loads(response.content)
+        except ValueError:
+            raise BinanceRequestException('Invalid Response: %s' % response.text)
+
+
+class OrderSafeRetry(Retry):
+    """
+    Retry policy that never re-sends an order that may have been executed.
+    
+    GET/DELETE requests are retried on rate limits and server errors. POST requests
+    (order placement) are only retried on 429, which Binance returns for requests it
+    rejected without processing. 418 (IP ban) is never retried.
+    
+    Retries re-send the same signed query, so its timestamp is frozen: a Retry-After
+    longer than MAX_RETRY_WAIT (about recvWindow, 5 s by default) gives up instead of
+    sleeping, and the rate-limit response is returned to the caller.
+    """
+    
+    RATE_LIMIT_STATUSES = frozenset((429,))
+    MAX_RETRY_WAIT = 5.0  # seconds
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == 'POST':
+            return bool(self.total) and status_code in self.RATE_LIMIT_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > self.MAX_RETRY_WAIT:
+                raise MaxRetryError(_pool, url, ResponseError(
+                    f"Retry-After of {retry_after} s exceeds {self.MAX_RETRY_WAIT} s"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class LowLatencyAdapter(HTTPAdapter):
+    """HTTPAdapter that flushes small writes immediately and keeps idle sockets alive."""
+    
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+class WebSocketAPIError(Exception):
+    """Error response returned by the Binance WebSocket API."""
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"{status_code} - {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class OrderStatusUnknownError(Exception):
+    """An order was sent but no acknowledgement arrived; it may be live on the exchange."""
+
+
+class WebSocketOrderClient:
+    """
+    Places orders over a persistent Binance Futures WebSocket API connection.
+    
+    The connection lives on an asyncio loop in a background thread; requests are
+    matched to responses by id and the connection is re-opened after it closes.
+    """
+    
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True, timeout: float = 10.0):
+        """
+        Args:
+            api_key: Binance API key
+            api_secret: Binance API secret
+            testnet: Whether to use testnet (default: True)
+            timeout: Seconds to wait for an order acknowledgement
+        """
+        if websockets is None:
+            raise RuntimeError("The 'websockets' package is required for the WebSocket API")
+        
+        self.api_key = api_key
+        self._signer = HmacSigner(api_secret)
+        self.url = WS_API_TESTNET_URL if testnet else WS_API_URL
+        self.timeout = timeout
+        self._ws = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._unacked: Dict[str, asyncio.Future] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+    
+    async def _connect(self):
+        """Open the connection (once) and start reading responses."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._ws is None:
+                self._ws = await websockets.connect(self.url)
+                self._loop.create_task(self._read(self._ws))
+                logger.info("WebSocket API connected: %s", self.url)
+        return self._ws
+    
+    async def _read(self, ws):
+        """Resolve pending requests as responses arrive; fail them if the connection drops."""
+        try:
+            async for message in ws:
+                response = json_loads(message)
+                future = self._unacked.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except websockets.exceptions.ConnectionClosed as e:
+            logger.warning("WebSocket API connection closed: %s", e)
+        except Exception as e:
+            logger.error("WebSocket API reader failed, dropping connection: %s", e)
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            for future in self._unacked.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket API connection closed"))
+            self._unacked.clear()
+            await ws.close()
+    
+    async def _request(self, method: str, params: Dict[str, str]) -> Dict[str, Any]:
+        ws = await self._connect()
+        request_id = uuid.uuid4().hex
+        future = self._loop.create_future()
+        self._unacked[request_id] = future
+        sent = False
+        try:
+            await ws.send(json_dumps({'id': request_id, 'method': method, 'params': params}))
+            sent = True
+            return await future
+        except ConnectionError as e:
+            # Once the request is on the wire the exchange may have acted on it
+            if sent:
+                raise OrderStatusUnknownError(f"Connection closed before acknowledgement: {e}") from None
+            raise
+        finally:
+            self._unacked.pop(request_id, None)
+    
+    def place_order(self, **params) -> Dict[str, Any]:
+        """
+        Sign and send an order.place request, blocking until it is acknowledged.
+        
+        Raises:
+            WebSocketAPIError: The order was rejected
+            OrderStatusUnknownError: The order was sent but no acknowledgement arrived
+                                     (timeout or connection closed)
+        """
+        params = {key: str(value) for key, value in params.items()}
+        params['apiKey'] = self.api_key
+        params['timestamp'] = str(int(time.time() * 1000))
+        query = '&'.join(f"{key}={params[key]}" for key in sorted(params))
+        params['signature'] = self._signer.sign(query.encode())
+        
+        future = asyncio.run_coroutine_threadsafe(self._request('order.place', params), self._loop)
+        try:
+            response = future.result(self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise OrderStatusUnknownError(f"No acknowledgement within {self.timeout} s") from None
+        except Exception:
+            future.cancel()
+            raise
+        
+        if response.get('status') != 200:
+            error = response.get('error', {})
+            raise WebSocketAPIError(error.get('code', response.get('status')), error.get('msg', 'Unknown error'))
+        return response['result']
+    
+    def close(self):
+        """Close the connection and stop the background loop."""
+        async def shutdown():
+            if self._ws is not None:
+                await self._ws.close()
+        
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(self.timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(self.timeout)
+
 
 class BasicBot:
     """
     A trading bot for Binance Futures Testnet supporting market, limit, and advanced order types.
     """
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    __slots__ = ('client', 'ws_client', '_symbols_cache', '_symbols_cache_time', '_symbols_cache_ttl',
+                 '_keepalive_stop', '_keepalive_thread')
+    
+    _SIDES = frozenset(('BUY', 'SELL'))
+    
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True, use_websocket: bool = False):
         """
         Initialize the trading bot with API credentials.
         
@@ -32,55 +336,171 @@ class BasicBot:
             api_key: Binance API key
             api_secret: Binance API secret
             testnet: Whether to use testnet (default: True)
+            use_websocket: Place orders over the WebSocket API instead of REST (default: False)
         """
         try:
-            self.client = Client(api_key, api_secret, testnet=testnet)
+            self.client = BotClient(api_key, api_secret, testnet=testnet)
+            self.ws_client = WebSocketOrderClient(api_key, api_secret, testnet=testnet) if use_websocket else None
+            self._symbols_cache: Optional[frozenset] = None
+            self._symbols_cache_time: Optional[datetime] = None
+            self._symbols_cache_ttl = 3600  # seconds
+            self._configure_session()
             if testnet:
                 self.client.API_URL = 'https://testnet.binancefuture.com'
+            else:
+                self._select_fastest_endpoint()
             
             logger.info("Bot initialized successfully")
-            logger.info(f"Using {'TESTNET' if testnet else 'LIVE'} environment")
+            logger.info("Using %s environment", 'TESTNET' if testnet else 'LIVE')
+            if self.ws_client:
+                logger.info("Placing orders over the WebSocket API")
             
             # Test connection
             self._test_connection()
+            
+            self._keepalive_stop = threading.Event()
+            self._keepalive_thread = threading.Thread(target=self._keepalive, daemon=True)
+            self._keepalive_thread.start()
         except Exception as e:
-            logger.error(f"Failed to initialize bot: {str(e)}")
+            logger.error("Failed to initialize bot: %s", e)
             raise
     
+    def _configure_session(self):
+        """Reuse pooled keep-alive connections so each API call skips the TCP/TLS handshake."""
+        retry = OrderSafeRetry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'DELETE']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = LowLatencyAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        self.client.session.mount('https://', adapter)
+        self.client.session.headers.update({
+            'Connection': 'keep-alive',
+            'Keep-Alive': 'timeout=90, max=1000'
+        })
+    
+    def _select_fastest_endpoint(self):
+        """
+        Ping the alternate futures hosts and route all futures calls to the fastest one.
+        
+        Probes use plain requests without the session's retry policy, so an
+        unreachable host costs a single timeout and timings aren't skewed by retries.
+        """
+        timings = {}
+        for host in FUTURES_HOSTS:
+            try:
+                response = requests.get(f'https://{host}/fapi/v1/ping', timeout=2)
+                response.raise_for_status()
+                timings[host] = response.elapsed.total_seconds()
+            except Exception as e:
+                logger.warning("Endpoint %s unreachable: %s", host, e)
+        
+        if not timings:
+            logger.warning("No futures endpoint responded, keeping default")
+            return
+        
+        host = min(timings, key=timings.get)
+        self.client.FUTURES_URL = f'https://{host}/fapi'
+        logger.info("Using futures endpoint %s (%.1f ms)", host, timings[host] * 1000)
+    
     def _test_connection(self):
         """Test API connection and log account info."""
         try:
             account = self.client.futures_account()
             logger.info("Connection successful")
-            logger.info(f"Account balance: {account.get('totalWalletBalance', 'N/A')} USDT")
+            logger.info("Account balance: %s USDT", account.get('totalWalletBalance', 'N/A'))
+            
+            # Prefetch symbols so order placement doesn't pay for exchange info
+            self._refresh_symbols()
+            logger.info("Loaded %s futures symbols", len(self._symbols_cache))
         except Exception as e:
-            logger.error(f"Connection test failed: {str(e)}")
+            logger.error("Connection test failed: %s", e)
             raise
     
+    def _keepalive(self):
+        """Ping the futures API periodically so pooled connections survive idle user prompts."""
+        while not self._keepalive_stop.wait(KEEPALIVE_INTERVAL):
+            try:
+                self.client.futures_ping()
+            except Exception as e:
+                logger.warning("Keep-alive ping failed: %s", e)
+    
+    def _refresh_symbols(self):
+        """Fetch the tradable futures symbols into the symbol cache."""
+        exchange_info = self.client.futures_exchange_info()
+        self._symbols_cache = frozenset(s['symbol'] for s in exchange_info['symbols'])
+        self._symbols_cache_time = datetime.now()
+    
     def _validate_symbol(self, symbol: str) -> bool:
-        """Validate if symbol exists on Binance Futures."""
+        """
+        Validate if an (already uppercased) symbol exists on Binance Futures.
+        
+        Served from the symbol cache prefetched at startup; exchange info is only
+        re-fetched on a cache miss or once the cache is older than _symbols_cache_ttl.
+        """
         try:
-            exchange_info = self.client.futures_exchange_info()
-            symbols = [s['symbol'] for s in exchange_info['symbols']]
-            return symbol.upper() in symbols
+            if self._symbols_cache and symbol in self._symbols_cache and \
+                    (datetime.now() - self._symbols_cache_time).total_seconds() < self._symbols_cache_ttl:
+                return True
+            
+            self._refresh_symbols()
+            return symbol in self._symbols_cache
         except Exception as e:
-            logger.error(f"Symbol validation failed: {str(e)}")
+            logger.error("Symbol validation failed: %s", e)
             return False
     
+    def _validate_common(self, symbol: str, side: str, *positives: float, message: str) -> Tuple[str, str]:
+        """
+        Validate the inputs shared by all order types.
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            side: 'BUY' or 'SELL'
+            *positives: Quantities/prices that must be positive
+            message: Error message raised when any of positives is not positive
+            
+        Returns:
+            Uppercased (symbol, side)
+        """
+        symbol = symbol.upper()
+        side = side.upper()
+        
+        if not self._validate_symbol(symbol):
+            raise ValueError(f"Invalid symbol: {symbol}")
+        
+        if side not in self._SIDES:
+            raise ValueError("Side must be 'BUY' or 'SELL'")
+        
+        if any(value <= 0 for value in positives):
+            raise ValueError(message)
+        
+        return symbol, side
+    
+    def _create_order(self, **params) -> Dict[str, Any]:
+        """Send an order over the WebSocket API when enabled, otherwise over REST."""
+        if self.ws_client:
+            return self.ws_client.place_order(**params)
+        return self.client.futures_create_order(**params)
+    
     def _log_order_details(self, order: Dict[str, Any]):
-        """Log order details in a readable format."""
-        logger.info("="*50)
-        logger.info("ORDER EXECUTED SUCCESSFULLY")
-        logger.info("="*50)
-        logger.info(f"Order ID: {order.get('orderId')}")
-        logger.info(f"Symbol: {order.get('symbol')}")
-        logger.info(f"Side: {order.get('side')}")
-        logger.info(f"Type: {order.get('type')}")
-        logger.info(f"Quantity: {order.get('origQty')}")
-        logger.info(f"Price: {order.get('price', 'MARKET')}")
-        logger.info(f"Status: {order.get('status')}")
-        logger.info(f"Time: {datetime.fromtimestamp(order.get('updateTime', 0)/1000)}")
-        logger.info("="*50)
+        """Log order details in a readable format (as a single record)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        logger.info(
+            ORDER_DETAILS_FORMAT,
+            order.get('orderId'),
+            order.get('symbol'),
+            order.get('side'),
+            order.get('type'),
+            order.get('origQty'),
+            order.get('price', 'MARKET'),
+            order.get('status'),
+            time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(order.get('updateTime', 0) // 1000))
+        )
     
     def place_market_order(self, symbol: str, side: str, quantity: float) -> Optional[Dict]:
         """
@@ -95,22 +515,12 @@ class BasicBot:
             Order response dict or None if failed
         """
         try:
-            symbol = symbol.upper()
-            side = side.upper()
+            symbol, side = self._validate_common(symbol, side, quantity,
+                                                 message="Quantity must be positive")
             
-            # Validate inputs
-            if not self._validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
+            logger.info("Placing MARKET %s order for %s %s", side, quantity, symbol)
             
-            if side not in ['BUY', 'SELL']:
-                raise ValueError("Side must be 'BUY' or 'SELL'")
-            
-            if quantity <= 0:
-                raise ValueError("Quantity must be positive")
-            
-            logger.info(f"Placing MARKET {side} order for {quantity} {symbol}")
-            
-            order = self.client.futures_create_order(
+            order = self._create_order(
                 symbol=symbol,
                 side=side,
                 type='MARKET',
@@ -121,13 +531,19 @@ class BasicBot:
             return order
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.status_code} - {e.message}")
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return None
+        except WebSocketAPIError as e:
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return None
+        except OrderStatusUnknownError as e:
+            logger.error("Order status unknown, check open orders before retrying: %s", e)
             return None
         except BinanceOrderException as e:
-            logger.error(f"Order Error: {e.status_code} - {e.message}")
+            logger.error("Order Error: %s - %s", e.status_code, e.message)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error placing market order: {str(e)}")
+            logger.error("Unexpected error placing market order: %s", e)
             return None
     
     def place_limit_order(self, symbol: str, side: str, quantity: float, price: float) -> Optional[Dict]:
@@ -144,22 +560,12 @@ class BasicBot:
             Order response dict or None if failed
         """
         try:
-            symbol = symbol.upper()
-            side = side.upper()
+            symbol, side = self._validate_common(symbol, side, quantity, price,
+                                                 message="Quantity and price must be positive")
             
-            # Validate inputs
-            if not self._validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
+            logger.info("Placing LIMIT %s order for %s %s at %s", side, quantity, symbol, price)
             
-            if side not in ['BUY', 'SELL']:
-                raise ValueError("Side must be 'BUY' or 'SELL'")
-            
-            if quantity <= 0 or price <= 0:
-                raise ValueError("Quantity and price must be positive")
-            
-            logger.info(f"Placing LIMIT {side} order for {quantity} {symbol} at {price}")
-            
-            order = self.client.futures_create_order(
+            order = self._create_order(
                 symbol=symbol,
                 side=side,
                 type='LIMIT',
@@ -172,13 +578,19 @@ class BasicBot:
             return order
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.status_code} - {e.message}")
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return None
+        except WebSocketAPIError as e:
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return None
+        except OrderStatusUnknownError as e:
+            logger.error("Order status unknown, check open orders before retrying: %s", e)
             return None
         except BinanceOrderException as e:
-            logger.error(f"Order Error: {e.status_code} - {e.message}")
+            logger.error("Order Error: %s - %s", e.status_code, e.message)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error placing limit order: {str(e)}")
+            logger.error("Unexpected error placing limit order: %s", e)
             return None
     
     def place_stop_limit_order(self, symbol: str, side: str, quantity: float, 
@@ -197,23 +609,15 @@ class BasicBot:
             Order response dict or None if failed
         """
         try:
-            symbol = symbol.upper()
-            side = side.upper()
-            
-            # Validate inputs
-            if not self._validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
-            
-            if side not in ['BUY', 'SELL']:
-                raise ValueError("Side must be 'BUY' or 'SELL'")
-            
-            if quantity <= 0 or stop_price <= 0 or limit_price <= 0:
-                raise ValueError("Quantity, stop price, and limit price must be positive")
+            symbol, side = self._validate_common(
+                symbol, side, quantity, stop_price, limit_price,
+                message="Quantity, stop price, and limit price must be positive"
+            )
             
-            logger.info(f"Placing STOP_LIMIT {side} order for {quantity} {symbol}")
-            logger.info(f"Stop Price: {stop_price}, Limit Price: {limit_price}")
+            logger.info("Placing STOP_LIMIT %s order for %s %s", side, quantity, symbol)
+            logger.info("Stop Price: %s, Limit Price: %s", stop_price, limit_price)
             
-            order = self.client.futures_create_order(
+            order = self._create_order(
                 symbol=symbol,
                 side=side,
                 type='STOP',
@@ -227,15 +631,154 @@ class BasicBot:
             return order
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.status_code} - {e.message}")
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return None
+        except WebSocketAPIError as e:
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return None
+        except OrderStatusUnknownError as e:
+            logger.error("Order status unknown, check open orders before retrying: %s", e)
             return None
         except BinanceOrderException as e:
-            logger.error(f"Order Error: {e.status_code} - {e.message}")
+            logger.error("Order Error: %s - %s", e.status_code, e.message)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error placing stop-limit order: {str(e)}")
+            logger.error("Unexpected error placing stop-limit order: %s", e)
             return None
     
+    def place_batch_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[Dict]]:
+        """
+        Place up to 5 orders in a single request (POST /fapi/v1/batchOrders).
+        
+        Args:
+            orders: List of order parameter dicts as accepted by futures_create_order
+                    (e.g. {'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT', ...})
+                    
+        Returns:
+            List of order responses (None for rejected orders), in input order
+        """
+        try:
+            if not 0 < len(orders) <= 5:
+                raise ValueError("A batch must contain between 1 and 5 orders")
+            
+            batch = []
+            for order in orders:
+                params = {key: str(value) for key, value in order.items()}
+                positives = [float(order[key]) for key in ('quantity', 'price', 'stopPrice') if key in order]
+                params['symbol'], params['side'] = self._validate_common(
+                    params.get('symbol', ''), params.get('side', ''), *positives,
+                    message="Quantity and prices must be positive"
+                )
+                batch.append(params)
+            
+            logger.info("Placing batch of %s orders", len(batch))
+            
+            results = self.client.futures_place_batch_order(batchOrders=batch)
+            
+            placed = []
+            for result in results:
+                if 'code' in result:
+                    logger.error("Batch order rejected: %s - %s", result.get('code'), result.get('msg'))
+                    placed.append(None)
+                else:
+                    self._log_order_details(result)
+                    placed.append(result)
+            return placed
+            
+        except BinanceAPIException as e:
+            logger.error("Binance API Error: %s - %s", e.status_code, e.message)
+            return []
+        except BinanceOrderException as e:
+            logger.error("Order Error: %s - %s", e.status_code, e.message)
+            return []
+        except Exception as e:
+            logger.error("Unexpected error placing batch orders: %s", e)
+            return []
+    
+    def place_bracket_order(self, symbol: str, side: str, quantity: float,
+                            price: float, stop_loss_price: float) -> List[Optional[Dict]]:
+        """
+        Place a limit entry and its protective stop-loss in one batch request.
+        
+        Binance accepts or rejects each order of a batch independently, so if the
+        entry is accepted but the stop-loss is not, the entry is cancelled rather
+        than left live without protection.
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            side: Entry side, 'BUY' or 'SELL'
+            quantity: Order quantity
+            price: Entry limit price
+            stop_loss_price: Stop-loss trigger price
+            
+        Returns:
+            List of [entry, stop-loss] responses (None for rejected or cancelled
+            orders), or an empty list if the bracket was not sent
+        """
+        try:
+            symbol, side = self._validate_common(
+                symbol, side, quantity, price, stop_loss_price,
+                message="Quantity, price, and stop-loss price must be positive"
+            )
+            
+            if side == 'BUY' and stop_loss_price >= price:
+                raise ValueError("Stop-loss price must be below the entry price for a BUY")
+            if side == 'SELL' and stop_loss_price <= price:
+                raise ValueError("Stop-loss price must be above the entry price for a SELL")
+        except ValueError as e:
+            logger.error("Invalid bracket order: %s", e)
+            return []
+        
+        exit_side = 'SELL' if side == 'BUY' else 'BUY'
+        results = self.place_batch_orders([
+            {
+                'symbol': symbol,
+                'side': side,
+                'type': 'LIMIT',
+                'timeInForce': 'GTC',
+                'quantity': quantity,
+                'price': price
+            },
+            {
+                'symbol': symbol,
+                'side': exit_side,
+                'type': 'STOP_MARKET',
+                'quantity': quantity,
+                'stopPrice': stop_loss_price,
+                'reduceOnly': 'true'
+            }
+        ])
+        
+        if len(results) == 2 and results[0] and not results[1]:
+            results[0] = self._cancel_unprotected_entry(symbol, results[0])
+        return results
+    
+    def _cancel_unprotected_entry(self, symbol: str, entry: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Cancel a bracket entry whose stop-loss was rejected.
+        
+        Returns:
+            None if the entry was cancelled unfilled, otherwise the entry order
+            (which is then live or filled without a stop-loss)
+        """
+        entry_id = entry.get('orderId')
+        logger.error("Stop-loss rejected, cancelling entry order %s", entry_id)
+        try:
+            cancelled = self.client.futures_cancel_order(symbol=symbol, orderId=entry_id)
+        except Exception as e:
+            logger.critical("Could not cancel entry order %s (%s): it is LIVE WITHOUT A STOP-LOSS, "
+                            "cancel it or place a stop manually", entry_id, e)
+            return entry
+        
+        if float(cancelled.get('executedQty', 0)) > 0:
+            logger.critical("Entry order %s was partially filled (%s) before being cancelled: "
+                            "the position has NO STOP-LOSS, close it or place a stop manually",
+                            entry_id, cancelled.get('executedQty'))
+            return entry
+        
+        logger.info("Entry order %s cancelled", entry_id)
+        return None
+    
     def get_open_orders(self, symbol: Optional[str] = None) -> list:
         """Get all open orders."""
         try:
@@ -244,10 +787,10 @@ class BasicBot:
             else:
                 orders = self.client.futures_get_open_orders()
             
-            logger.info(f"Retrieved {len(orders)} open orders")
+            logger.info("Retrieved %s open orders", len(orders))
             return orders
         except Exception as e:
-            logger.error(f"Error getting open orders: {str(e)}")
+            logger.error("Error getting open orders: %s", e)
             return []
     
     def cancel_order(self, symbol: str, order_id: int) -> bool:
@@ -257,34 +800,53 @@ class BasicBot:
                 symbol=symbol.upper(),
                 orderId=order_id
             )
-            logger.info(f"Order {order_id} cancelled successfully")
+            logger.info("Order %s cancelled successfully", order_id)
             return True
         except Exception as e:
-            logger.error(f"Error cancelling order: {str(e)}")
+            logger.error("Error cancelling order: %s", e)
             return False
+    
+    def close(self):
+        """Release network resources held by the bot."""
+        self._keepalive_stop.set()
+        self._keepalive_thread.join()
+        if self.ws_client:
+            self.ws_client.close()
+
+
+# CLI menus, each written to stdout in a single call
+_MENU = (
+    "\n" + "="*60 + "\n"
+    "BINANCE FUTURES TRADING BOT - TESTNET\n" +
+    "="*60 + "\n"
+    "\nSelect Order Type:\n"
+    "1. Market Order\n"
+    "2. Limit Order\n"
+    "3. Stop-Limit Order (Bonus)\n"
+    "4. Bracket Order (Limit Entry + Stop-Loss)\n"
+)
+
+_SIDE_MENU = (
+    "\nSelect Side:\n"
+    "1. BUY\n"
+    "2. SELL\n"
+)
 
 
 def get_user_input() -> Dict[str, Any]:
     """Get order details from user via CLI."""
-    print("\n" + "="*60)
-    print("BINANCE FUTURES TRADING BOT - TESTNET")
-    print("="*60)
-    
     # Order type
-    print("\nSelect Order Type:")
-    print("1. Market Order")
-    print("2. Limit Order")
-    print("3. Stop-Limit Order (Bonus)")
+    sys.stdout.write(_MENU)
+    sys.stdout.flush()
     
-    order_type = input("\nEnter choice (1-3): ").strip()
+    order_type = input("\nEnter choice (1-4): ").strip()
     
     # Symbol
     symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
     
     # Side
-    print("\nSelect Side:")
-    print("1. BUY")
-    print("2. SELL")
+    sys.stdout.write(_SIDE_MENU)
+    sys.stdout.flush()
     side_choice = input("Enter choice (1-2): ").strip()
     side = "BUY" if side_choice == "1" else "SELL"
     
@@ -301,6 +863,9 @@ def get_user_input() -> Dict[str, Any]:
     elif order_type == "3":  # Stop-limit order
         stop_price = float(input("Enter stop price: ").strip())
         limit_price = float(input("Enter limit price: ").strip())
+    elif order_type == "4":  # Bracket order
+        price = float(input("Enter entry limit price: ").strip())
+        stop_price = float(input("Enter stop-loss price: ").strip())
     
     return {
         'order_type': order_type,
@@ -318,13 +883,20 @@ def main():
     print("Binance Futures Trading Bot - Testnet")
     print("="*60)
     
+    # Set BINANCE_USE_WEBSOCKET=1 to place orders over the WebSocket API
+    use_websocket = os.environ.get('BINANCE_USE_WEBSOCKET', '').lower() in ('1', 'true', 'yes')
+    
     # Get API credentials
-    api_key = "TSnFKBzElWEqE923PO7lzM0SzUnMYmDw6liFlHHtIXfISSBp3dIneW8W8Tn51ROH"
-    api_secret = "cKbBUvB7cV7zyFGuHlRND63lN5kuDMqjNJh9AXhyDcH1AW8CFGQE9yeSGY2FlY7I"
+    api_key = os.environ.get('BINANCE_API_KEY')
+    api_secret = os.environ.get('BINANCE_API_SECRET')
+    if not api_key or not api_secret:
+        logger.error("BINANCE_API_KEY and BINANCE_API_SECRET environment variables must be set")
+        sys.exit(1)
     
+    bot = None
     try:
         # Initialize bot
-        bot = BasicBot(api_key, api_secret, testnet=True)
+        bot = BasicBot(api_key, api_secret, testnet=True, use_websocket=use_websocket)
         
         while True:
             # Get user input
@@ -352,6 +924,16 @@ def main():
                     order_params['stop_price'],
                     order_params['limit_price']
                 )
+            elif order_params['order_type'] == '4':
+                results = bot.place_bracket_order(
+                    order_params['symbol'],
+                    order_params['side'],
+                    order_params['quantity'],
+                    order_params['price'],
+                    order_params['stop_price']
+                )
+                if not results or not all(results):
+                    print("\nWARNING: Bracket order was not placed in full, check the log for details")
             else:
                 logger.error("Invalid order type selected")
             
@@ -364,8 +946,11 @@ def main():
     except KeyboardInterrupt:
         print("\n\nBot stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
+    finally:
+        if bot:
+            bot.close()
 
 
 if __name__ == "__main__":